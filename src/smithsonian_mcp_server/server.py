@@ -7,9 +7,13 @@ Smithsonian collections.
 """
 
 import os
+import time
 import asyncio
-from typing import Any, Optional
+import functools
+from itertools import islice
+from typing import Any, Iterator, NamedTuple, Optional
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.types import (
     Resource,
@@ -24,14 +28,195 @@ import mcp.server.stdio
 
 # API configuration
 SMITHSONIAN_API_BASE = "https://api.si.edu/openaccess/api/v1.0"
+MAX_ROWS_PER_REQUEST = 1000
+MAX_SEARCH_ROWS = 10000
+MAX_EXPAND_ITEMS = 20
 DEFAULT_API_KEY = os.getenv("SMITHSONIAN_API_KEY", "")
 
+# HTTP connection pool configuration
+MAX_CONNECTIONS = int(os.getenv("SMITHSONIAN_MAX_CONNECTIONS", "32"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("SMITHSONIAN_MAX_KEEPALIVE_CONNECTIONS", "16"))
+KEEPALIVE_EXPIRY = 30.0
+
+# Response cache lifetimes in seconds, per endpoint
+SEARCH_CACHE_TTL = 180.0
+ITEM_CACHE_TTL = 900.0
+TERMS_CACHE_TTL = 3600.0
+# Limits on the cache, measured in response body bytes as received from the API.
+# Decoded payloads take roughly 3x this much memory, so 16 MiB of responses is
+# about 50 MB resident.
+CACHE_MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+CACHE_MAX_ENTRY_RESPONSE_BYTES = 2 * 1024 * 1024
+# Seconds an expired response may still be served while it is revalidated
+CACHE_STALE_TTL = 3600.0
+# Seconds an expired response is kept to serve instead of an error while the API is down
+CACHE_FALLBACK_TTL = 86400.0
+
 
 app = Server("smithsonian-mcp-server")
 
+# Shared HTTP client, reused across tool calls so connections stay alive
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client used for all Smithsonian API requests."""
+    return httpx.AsyncClient(
+        base_url=SMITHSONIAN_API_BASE,
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class _CacheEntry(NamedTuple):
+    fresh_until: float
+    stale_until: float
+    expires_at: float
+    response_bytes: int
+    payload: dict[str, Any]
+
+
+# Decoded API responses keyed by (path, params), least recently used first.
+# Payloads are shared between callers and must not be mutated.
+_cache: dict[tuple, _CacheEntry] = {}
+_cache_response_bytes = 0
+# Upstream fetches in progress, shared by every caller waiting on the same key
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+def _cache_drop(key: tuple) -> None:
+    """Remove a response from the cache."""
+    global _cache_response_bytes
+    entry = _cache.pop(key, None)
+    if entry is not None:
+        _cache_response_bytes -= entry.response_bytes
+
+
+def _cache_store(key: tuple, entry: _CacheEntry) -> None:
+    """Add a response to the cache, evicting the least recently used ones to make room."""
+    global _cache_response_bytes
+    _cache_drop(key)
+    if entry.response_bytes > CACHE_MAX_ENTRY_RESPONSE_BYTES:
+        # Large pages would crowd out everything else
+        return
+    while _cache and _cache_response_bytes + entry.response_bytes > CACHE_MAX_RESPONSE_BYTES:
+        _cache_drop(next(iter(_cache)))
+    _cache[key] = entry
+    _cache_response_bytes += entry.response_bytes
+
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """Check whether an error is an API outage rather than a bad request."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
 
+
+async def _fetch(key: tuple, path: str, params: dict[str, Any], ttl: float) -> dict[str, Any]:
+    """Fetch an endpoint into the cache, falling back to a stale payload on outages."""
+    entry = _cache.get(key)
+    try:
+        client = get_http_client()
+        response = await client.get(path, params=params)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        # Serve the last good response rather than an error during outages
+        if entry is not None and _is_upstream_failure(e):
+            return entry.payload
+        raise
+
+    payload = orjson.loads(response.content)
+    fresh_until = time.monotonic() + ttl
+    _cache_store(
+        key,
+        _CacheEntry(
+            fresh_until=fresh_until,
+            stale_until=fresh_until + CACHE_STALE_TTL,
+            expires_at=fresh_until + CACHE_FALLBACK_TTL,
+            response_bytes=len(response.content),
+            payload=payload,
+        ),
+    )
+    return payload
+
+
+def _finish_fetch(key: tuple, task: asyncio.Task) -> None:
+    """Forget a finished upstream fetch."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Retrieve failures so unawaited background refreshes don't log warnings
+        task.exception()
+
+
+def _start_fetch(key: tuple, path: str, params: dict[str, Any], ttl: float) -> asyncio.Task:
+    """Get the in-progress fetch for a key, starting one if there is none."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch(key, path, params, ttl))
+        task.add_done_callback(functools.partial(_finish_fetch, key))
+        _inflight[key] = task
+    return task
+
+
+async def fetch_json(path: str, params: dict[str, Any], ttl: float) -> dict[str, Any]:
+    """
+    Fetch and decode a Smithsonian API endpoint, caching the result.
+
+    Concurrent requests for the same uncached endpoint and parameters share a
+    single upstream request. Once a cached response expires it is still served
+    for CACHE_STALE_TTL seconds while being revalidated in the background, and
+    for CACHE_FALLBACK_TTL seconds instead of an error if the API is unavailable.
+
+    Args:
+        path: Endpoint path relative to the API base URL
+        params: Query parameters
+        ttl: Number of seconds to cache the decoded response
+
+    Returns:
+        Dictionary containing the decoded response
+    """
+    key = (path, tuple(sorted(params.items())))
+    entry = _cache.get(key)
+    if entry is not None:
+        now = time.monotonic()
+        if now < entry.stale_until:
+            # Mark as most recently used
+            _cache[key] = _cache.pop(key)
+            if now >= entry.fresh_until:
+                _start_fetch(key, path, params, ttl)
+            return entry.payload
+        if now >= entry.expires_at:
+            _cache_drop(key)
+
+    # Shield the shared fetch so one cancelled caller doesn't cancel it for the others
+    return await asyncio.shield(_start_fetch(key, path, params, ttl))
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
-    """Get the Smithsonian API key from environment variable."""
+    """Get the Smithsonian API key from environment variable, read once on first use."""
     api_key = os.getenv("SMITHSONIAN_API_KEY", DEFAULT_API_KEY)
     if not api_key:
         raise ValueError(
@@ -59,25 +244,70 @@ async def search_smithsonian(
     Returns:
         Dictionary containing search results
     """
-    api_key = get_api_key()
-
     params = {
-        "api_key": api_key,
+        "api_key": get_api_key(),
         "q": query,
-        "rows": min(rows, 1000),
+        "rows": rows if rows < MAX_ROWS_PER_REQUEST else MAX_ROWS_PER_REQUEST,
         "start": start,
     }
 
     if online_media:
         params["online_media_type"] = "Images"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            f"{SMITHSONIAN_API_BASE}/search",
-            params=params,
-        )
-        response.raise_for_status()
-        return response.json()
+    return await fetch_json("/search", params, SEARCH_CACHE_TTL)
+
+
+async def search_smithsonian_paged(
+    query: str,
+    total_rows: int,
+    start: int = 0,
+    page: int = MAX_ROWS_PER_REQUEST,
+    online_media: bool = False,
+) -> dict[str, Any]:
+    """
+    Search the Smithsonian collections, fetching large result sets in parallel pages.
+
+    Args:
+        query: Search query string
+        total_rows: Total number of results to return
+        start: Starting offset for pagination (default 0)
+        page: Number of results per request (default 1000, max 1000)
+        online_media: Only return items with online media (default False)
+
+    Returns:
+        Dictionary containing search results, with the rows of all pages combined
+    """
+    if page > MAX_ROWS_PER_REQUEST:
+        page = MAX_ROWS_PER_REQUEST
+
+    # The first page tells us how many results there are, so we only request pages that exist
+    first_page = await search_smithsonian(
+        query=query,
+        rows=min(page, total_rows),
+        start=start,
+        online_media=online_media,
+    )
+    response = first_page.get("response", {})
+    row_count = response.get("rowCount", 0)
+    rows: list[Any] = list(response.get("rows") or [])
+    end = min(start + total_rows, row_count)
+
+    semaphore = asyncio.Semaphore(10)
+
+    async def fetch_page(offset: int) -> dict[str, Any]:
+        async with semaphore:
+            return await search_smithsonian(
+                query=query,
+                rows=min(page, end - offset),
+                start=offset,
+                online_media=online_media,
+            )
+
+    pages = await asyncio.gather(*(fetch_page(offset) for offset in range(start + page, end, page)))
+    for data in pages:
+        rows.extend(data.get("response", {}).get("rows") or [])
+
+    return {"response": {"rowCount": row_count, "rows": rows}}
 
 
 async def get_item_details(item_id: str) -> dict[str, Any]:
@@ -94,13 +324,41 @@ async def get_item_details(item_id: str) -> dict[str, Any]:
 
     params = {"api_key": api_key}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            f"{SMITHSONIAN_API_BASE}/content/{item_id}",
-            params=params,
-        )
-        response.raise_for_status()
-        return response.json()
+    return await fetch_json(f"/content/{item_id}", params, ITEM_CACHE_TTL)
+
+
+async def search_with_details(
+    query: str,
+    top_k: int = 5,
+    online_media: bool = False,
+) -> tuple[dict[str, Any], list[tuple[str, Any]]]:
+    """
+    Search the Smithsonian collections and fetch details for the top results concurrently.
+
+    Args:
+        query: Search query string
+        top_k: Number of top results to fetch details for (default 5)
+        online_media: Only return items with online media (default False)
+
+    Returns:
+        Tuple of the search results and a list of (item_id, details) pairs for the
+        top items that have an ID, where details is either the details dictionary
+        or the exception raised while fetching them
+    """
+    data = await search_smithsonian(query=query, rows=top_k, online_media=online_media)
+    rows = data.get("response", {}).get("rows") or []
+    item_ids = [item_id for item_id in (item.get("id") for item in islice(rows, top_k)) if item_id]
+    semaphore = asyncio.Semaphore(8)
+
+    async def fetch_item(item_id: str) -> dict[str, Any]:
+        async with semaphore:
+            return await get_item_details(item_id)
+
+    details = await asyncio.gather(
+        *(fetch_item(item_id) for item_id in item_ids),
+        return_exceptions=True,
+    )
+    return data, list(zip(item_ids, details))
 
 
 async def get_category_terms(category: str, starts_with: str = "") -> dict[str, Any]:
@@ -124,208 +382,281 @@ async def get_category_terms(category: str, starts_with: str = "") -> dict[str,
     if starts_with:
         params["starts_with"] = starts_with
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            f"{SMITHSONIAN_API_BASE}/terms/{category}",
-            params=params,
-        )
-        response.raise_for_status()
-        return response.json()
+    return await fetch_json(f"/terms/{category}", params, TERMS_CACHE_TTL)
 
 
-def format_search_results(data: dict[str, Any]) -> str:
-    """Format search results into a readable text format."""
+# Shared empty mapping for lookups on missing nested fields; never mutated
+_EMPTY: dict[str, Any] = {}
+
+
+def _asdict(value: Any) -> dict[str, Any]:
+    """Return value if it is a dict, otherwise an empty dict."""
+    return value if type(value) is dict else _EMPTY
+
+
+def _row_links(item: dict[str, Any]) -> tuple[Optional[str], int]:
+    """Get a search row's record link and online media count."""
+    desc = _asdict(_asdict(item.get("content")).get("descriptiveNonRepeating"))
+    return desc.get("record_link"), _asdict(desc.get("online_media")).get("mediaCount", 0)
+
+
+def _iter_search_lines(data: dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of formatted search results."""
     response = data.get("response", {})
-    rows_returned = response.get("rowCount", 0)
+    rows = response.get("rows") or []
     total_rows = response.get("rowCount", 0)
 
-    result_lines = [
-        f"Found {total_rows} results",
-        f"Showing {rows_returned} items:",
-        "",
-    ]
+    yield f"Found {total_rows} results"
+    yield f"Showing {len(rows)} items:"
+    yield ""
 
-    for item in response.get("rows", []):
+    for item in rows:
         title = item.get("title", "Untitled")
         item_id = item.get("id", "Unknown ID")
         unit_code = item.get("unitCode", "")
 
-        result_lines.append(f"• {title}")
-        result_lines.append(f"  ID: {item_id}")
+        yield f"• {title}"
+        yield f"  ID: {item_id}"
 
         if unit_code:
-            result_lines.append(f"  Unit: {unit_code}")
+            yield f"  Unit: {unit_code}"
 
-        # Add content description if available
-        content = item.get("content", {})
-        if isinstance(content, dict):
-            desc = content.get("descriptiveNonRepeating", {})
-            if isinstance(desc, dict):
-                record_link = desc.get("record_link")
-                if record_link:
-                    result_lines.append(f"  Link: {record_link}")
+        # Add content description and online media if available
+        record_link, media_count = _row_links(item)
+        if record_link:
+            yield f"  Link: {record_link}"
 
-        # Check for online media
-        online_media = item.get("content", {}).get("descriptiveNonRepeating", {}).get("online_media", {})
-        if online_media and isinstance(online_media, dict):
-            media_count = online_media.get("mediaCount", 0)
-            if media_count > 0:
-                result_lines.append(f"  Online Media: {media_count} items available")
+        if media_count > 0:
+            yield f"  Online Media: {media_count} items available"
 
-        result_lines.append("")
+        yield ""
 
-    return "\n".join(result_lines)
 
+def format_search_results(data: dict[str, Any]) -> str:
+    """Format search results into a readable text format."""
+    return "\n".join(_iter_search_lines(data))
 
-def format_item_details(data: dict[str, Any]) -> str:
-    """Format item details into a readable text format."""
+
+def project_search_results(data: dict[str, Any]) -> dict[str, Any]:
+    """Extract the fields shown in formatted search results into a compact structure."""
     response = data.get("response", {})
+    rows = response.get("rows") or []
+    items = []
+
+    for item in rows:
+        record_link, media_count = _row_links(item)
+        items.append(
+            {
+                "title": item.get("title"),
+                "id": item.get("id"),
+                "unitCode": item.get("unitCode"),
+                "record_link": record_link,
+                "media_count": media_count,
+            }
+        )
 
-    result_lines = ["Item Details:", ""]
+    return {"total": response.get("rowCount", 0), "returned": len(rows), "items": items}
+
+
+def _iter_item_lines(data: dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of formatted item details."""
+    response = data.get("response", {})
+
+    yield "Item Details:"
+    yield ""
 
     # Basic info
     title = response.get("title", "Untitled")
     item_id = response.get("id", "Unknown")
     unit_code = response.get("unitCode", "")
 
-    result_lines.append(f"Title: {title}")
-    result_lines.append(f"ID: {item_id}")
+    yield f"Title: {title}"
+    yield f"ID: {item_id}"
 
     if unit_code:
-        result_lines.append(f"Unit: {unit_code}")
+        yield f"Unit: {unit_code}"
 
-    result_lines.append("")
+    yield ""
 
     # Content details
-    content = response.get("content", {})
-    if isinstance(content, dict):
-        # Descriptive info
-        desc = content.get("descriptiveNonRepeating", {})
-        if isinstance(desc, dict):
-            record_link = desc.get("record_link")
-            if record_link:
-                result_lines.append(f"Record Link: {record_link}")
-
-            # Data source
-            data_source = desc.get("data_source")
-            if data_source:
-                result_lines.append(f"Data Source: {data_source}")
-
-            # Online media
-            online_media = desc.get("online_media", {})
-            if online_media and isinstance(online_media, dict):
-                result_lines.append("")
-                result_lines.append("Online Media:")
-                media_count = online_media.get("mediaCount", 0)
-                result_lines.append(f"  Total Items: {media_count}")
-
-                # List media items
-                for media in online_media.get("media", [])[:5]:  # Show first 5
-                    if isinstance(media, dict):
-                        media_type = media.get("type", "Unknown")
-                        media_url = media.get("content", "")
-                        result_lines.append(f"  - {media_type}: {media_url}")
-
-        # Free text fields
-        freetext = content.get("freetext", {})
-        if isinstance(freetext, dict):
-            result_lines.append("")
-            result_lines.append("Additional Information:")
-
-            for key, values in freetext.items():
-                if isinstance(values, list) and values:
-                    result_lines.append(f"  {key}:")
-                    for item in values[:3]:  # Show first 3
-                        if isinstance(item, dict):
-                            label = item.get("label", "")
-                            content_text = item.get("content", "")
-                            if label:
-                                result_lines.append(f"    {label}: {content_text}")
-                            else:
-                                result_lines.append(f"    {content_text}")
-
-    return "\n".join(result_lines)
+    content = _asdict(response.get("content"))
 
+    # Descriptive info
+    desc = _asdict(content.get("descriptiveNonRepeating"))
+    record_link = desc.get("record_link")
+    if record_link:
+        yield f"Record Link: {record_link}"
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="search_collection",
-            description=(
-                "Search the Smithsonian Institution's collections. "
-                "Search across millions of items including artifacts, artworks, specimens, and more. "
-                "Returns a list of matching items with basic information."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (supports keywords, phrases in quotes, AND/OR operators)",
-                    },
-                    "rows": {
-                        "type": "number",
-                        "description": "Number of results to return (default 10, max 1000)",
-                        "default": 10,
-                    },
-                    "start": {
-                        "type": "number",
-                        "description": "Starting offset for pagination (default 0)",
-                        "default": 0,
-                    },
-                    "online_media_only": {
-                        "type": "boolean",
-                        "description": "Only return items that have online media/images available",
-                        "default": False,
-                    },
+    # Data source
+    data_source = desc.get("data_source")
+    if data_source:
+        yield f"Data Source: {data_source}"
+
+    # Online media
+    online_media = _asdict(desc.get("online_media"))
+    if online_media:
+        yield ""
+        yield "Online Media:"
+        media_count = online_media.get("mediaCount", 0)
+        yield f"  Total Items: {media_count}"
+
+        # List media items
+        for media in islice(online_media.get("media", ()), 5):  # Show first 5
+            if type(media) is dict:
+                media_type = media.get("type", "Unknown")
+                media_url = media.get("content", "")
+                yield f"  - {media_type}: {media_url}"
+
+    # Free text fields
+    freetext = _asdict(content.get("freetext"))
+    yield ""
+    yield "Additional Information:"
+
+    for key, values in freetext.items():
+        # Checked explicitly rather than with _asdict: only non-empty lists get a heading
+        if type(values) is list and values:
+            yield f"  {key}:"
+            for item in islice(values, 3):  # Show first 3
+                if type(item) is dict:
+                    label = item.get("label", "")
+                    content_text = item.get("content", "")
+                    if label:
+                        yield f"    {label}: {content_text}"
+                    else:
+                        yield f"    {content_text}"
+
+
+def format_item_details(data: dict[str, Any]) -> str:
+    """Format item details into a readable text format."""
+    return "\n".join(_iter_item_lines(data))
+
+
+# Tool definitions, built once at import time
+_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="search_collection",
+        description=(
+            "Search the Smithsonian Institution's collections. "
+            "Search across millions of items including artifacts, artworks, specimens, and more. "
+            "Returns a list of matching items with basic information."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (supports keywords, phrases in quotes, AND/OR operators)",
+                },
+                "rows": {
+                    "type": "number",
+                    "description": (
+                        "Number of results to return (default 10, max 10000). "
+                        "More than 1000 results are fetched in parallel pages"
+                    ),
+                    "default": 10,
+                    "maximum": MAX_SEARCH_ROWS,
+                },
+                "start": {
+                    "type": "number",
+                    "description": "Starting offset for pagination (default 0)",
+                    "default": 0,
+                },
+                "online_media_only": {
+                    "type": "boolean",
+                    "description": "Only return items that have online media/images available",
+                    "default": False,
+                },
+                "structured": {
+                    "type": "boolean",
+                    "description": (
+                        "Return results as compact JSON (title, id, unitCode, record_link, "
+                        "media_count per item) instead of formatted text"
+                    ),
+                    "default": False,
                 },
-                "required": ["query"],
             },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_item",
+        description=(
+            "Get detailed information about a specific Smithsonian collection item. "
+            "Provides comprehensive metadata including descriptions, dates, creators, "
+            "physical details, and links to online media if available."
         ),
-        Tool(
-            name="get_item",
-            description=(
-                "Get detailed information about a specific Smithsonian collection item. "
-                "Provides comprehensive metadata including descriptions, dates, creators, "
-                "physical details, and links to online media if available."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "The Smithsonian item ID (obtained from search results)",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "string",
+                    "description": "The Smithsonian item ID (obtained from search results)",
                 },
-                "required": ["item_id"],
             },
+            "required": ["item_id"],
+        },
+    ),
+    Tool(
+        name="search_and_expand",
+        description=(
+            "Search the Smithsonian Institution's collections and return detailed information "
+            "for the top matching items in one step. "
+            "Item details are fetched in parallel, which is faster than searching and then "
+            "calling get_item for each result."
         ),
-        Tool(
-            name="get_category_terms",
-            description=(
-                "Get available terms/values for a specific category or facet. "
-                "Useful for discovering valid filter values. "
-                "Categories include: online_media_type, data_source, topic, place, and more."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Category name (e.g., 'online_media_type', 'data_source', 'topic', 'place')",
-                    },
-                    "starts_with": {
-                        "type": "string",
-                        "description": "Optional: filter terms that start with this string",
-                        "default": "",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (supports keywords, phrases in quotes, AND/OR operators)",
+                },
+                "top_k": {
+                    "type": "number",
+                    "description": "Number of top results to return details for (default 5, max 20)",
+                    "default": 5,
+                    "minimum": 1,
+                    "maximum": MAX_EXPAND_ITEMS,
+                },
+                "online_media_only": {
+                    "type": "boolean",
+                    "description": "Only return items that have online media/images available",
+                    "default": False,
                 },
-                "required": ["category"],
             },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_category_terms",
+        description=(
+            "Get available terms/values for a specific category or facet. "
+            "Useful for discovering valid filter values. "
+            "Categories include: online_media_type, data_source, topic, place, and more."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Category name (e.g., 'online_media_type', 'data_source', 'topic', 'place')",
+                },
+                "starts_with": {
+                    "type": "string",
+                    "description": "Optional: filter terms that start with this string",
+                    "default": "",
+                },
+            },
+            "required": ["category"],
+        },
+    ),
+)
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return list(_TOOLS)
 
 
 @app.call_tool()
@@ -337,16 +668,32 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             rows = arguments.get("rows", 10)
             start = arguments.get("start", 0)
             online_media_only = arguments.get("online_media_only", False)
+            structured = arguments.get("structured", False)
 
             if not query:
                 return [TextContent(type="text", text="Error: query parameter is required")]
 
-            data = await search_smithsonian(
-                query=query,
-                rows=rows,
-                start=start,
-                online_media=online_media_only,
-            )
+            if rows > MAX_SEARCH_ROWS:
+                rows = MAX_SEARCH_ROWS
+
+            if rows > MAX_ROWS_PER_REQUEST:
+                data = await search_smithsonian_paged(
+                    query=query,
+                    total_rows=int(rows),
+                    start=int(start),
+                    online_media=online_media_only,
+                )
+            else:
+                data = await search_smithsonian(
+                    query=query,
+                    rows=rows,
+                    start=start,
+                    online_media=online_media_only,
+                )
+
+            if structured:
+                result_text = orjson.dumps(project_search_results(data)).decode()
+                return [TextContent(type="text", text=result_text)]
 
             formatted_result = format_search_results(data)
             return [TextContent(type="text", text=formatted_result)]
@@ -381,6 +728,34 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             result_text = "\n".join(result_lines)
             return [TextContent(type="text", text=result_text)]
 
+        elif name == "search_and_expand":
+            query = arguments.get("query")
+            online_media_only = arguments.get("online_media_only", False)
+
+            if not query:
+                return [TextContent(type="text", text="Error: query parameter is required")]
+
+            top_k = min(max(int(arguments.get("top_k", 5)), 1), MAX_EXPAND_ITEMS)
+
+            data, details = await search_with_details(
+                query=query,
+                top_k=top_k,
+                online_media=online_media_only,
+            )
+
+            total_rows = data.get("response", {}).get("rowCount", 0)
+            result_parts = [
+                f"Found {total_rows} results, showing details for the top {len(details)}:"
+            ]
+            for item_id, item_data in details:
+                if isinstance(item_data, BaseException):
+                    result_parts.append(f"Item {item_id}: Error: {item_data}")
+                else:
+                    result_parts.append(format_item_details(item_data))
+
+            result_text = "\n\n".join(result_parts)
+            return [TextContent(type="text", text=result_text)]
+
         else:
             return [TextContent(type="text", text=f"Error: Unknown tool '{name}'")]
 
@@ -390,12 +765,15 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
 async def main():
     """Run the MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    global _client
+    async with create_http_client() as client:
+        _client = client
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
 
 
 if __name__ == "__main__":
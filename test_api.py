@@ -3,7 +3,11 @@
 import asyncio
 import os
 from dotenv import load_dotenv
-from smithsonian_mcp_server.server import search_smithsonian, get_item_details
+from smithsonian_mcp_server.server import (
+    aclose_http_client,
+    get_item_details,
+    search_smithsonian,
+)
 
 # Load environment variables from .env.example
 load_dotenv(".env.example")
@@ -77,8 +81,11 @@ async def main():
     print()
 
     # Run tests
-    item_id = await test_search()
-    await test_get_item(item_id)
+    try:
+        item_id = await test_search()
+        await test_get_item(item_id)
+    finally:
+        await aclose_http_client()
 
     print("\n" + "=" * 50)
     print("Tests completed!")
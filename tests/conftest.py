@@ -0,0 +1,59 @@
+"""Shared fixtures for the Smithsonian MCP server tests."""
+
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+import pytest
+
+from smithsonian_mcp_server import server
+
+
+class MockAPI:
+    """Stand-in for the Smithsonian API that records the requests it receives."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.handler: Optional[Callable[[httpx.Request], Awaitable[httpx.Response]]] = None
+
+    def respond(self, payload: Any = None, status_code: int = 200) -> None:
+        """Answer every request with the same JSON payload."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(status_code, json=payload if payload is not None else {})
+
+        self.handler = handler
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return await self.handler(request)
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("SMITHSONIAN_API_KEY", "test-key")
+    server.get_api_key.cache_clear()
+    yield
+    server.get_api_key.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    server._cache.clear()
+    server._cache_response_bytes = 0
+    server._inflight.clear()
+    yield
+    server._cache.clear()
+    server._cache_response_bytes = 0
+    server._inflight.clear()
+
+
+@pytest.fixture
+async def mock_api():
+    api = MockAPI()
+    api.respond({})
+    server._client = httpx.AsyncClient(
+        base_url=server.SMITHSONIAN_API_BASE,
+        transport=httpx.MockTransport(api),
+    )
+    yield api
+    await server.aclose_http_client()
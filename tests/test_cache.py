@@ -0,0 +1,193 @@
+"""Tests for the API response cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from smithsonian_mcp_server import server
+
+
+async def test_cache_hit_skips_upstream(mock_api):
+    mock_api.respond({"response": {"terms": ["Images"]}})
+
+    first = await server.fetch_json("/terms/online_media_type", {"q": "x"}, 60)
+    second = await server.fetch_json("/terms/online_media_type", {"q": "x"}, 60)
+
+    assert first == second == {"response": {"terms": ["Images"]}}
+    assert len(mock_api.requests) == 1
+
+
+async def test_cache_is_keyed_by_params(mock_api):
+    await server.fetch_json("/search", {"q": "apollo"}, 60)
+    await server.fetch_json("/search", {"q": "gemini"}, 60)
+
+    assert len(mock_api.requests) == 2
+
+
+async def test_concurrent_misses_share_one_request(mock_api):
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"response": {"rowCount": 1}})
+
+    mock_api.handler = handler
+
+    calls = [asyncio.create_task(server.fetch_json("/search", {"q": "x"}, 60)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert all(result == {"response": {"rowCount": 1}} for result in results)
+    assert len(mock_api.requests) == 1
+    assert not server._inflight
+
+
+async def test_concurrent_failures_share_one_request(mock_api):
+    mock_api.respond(status_code=503)
+
+    results = await asyncio.gather(
+        *(server.fetch_json("/search", {"q": "x"}, 60) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+    assert len(mock_api.requests) == 1
+    assert not server._inflight
+
+
+async def test_client_errors_are_not_cached(mock_api):
+    mock_api.respond(status_code=404)
+
+    for _ in range(2):
+        try:
+            await server.fetch_json("/content/missing", {}, 60)
+        except httpx.HTTPStatusError:
+            pass
+
+    assert len(mock_api.requests) == 2
+    assert not server._cache
+
+
+async def test_oversized_responses_are_not_cached(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "CACHE_MAX_ENTRY_RESPONSE_BYTES", 10)
+    mock_api.respond({"response": {"rows": ["a long enough payload"]}})
+
+    await server.fetch_json("/search", {"q": "x"}, 60)
+    await server.fetch_json("/search", {"q": "x"}, 60)
+
+    assert len(mock_api.requests) == 2
+    assert not server._cache
+    assert server._cache_response_bytes == 0
+
+
+async def test_least_recently_used_entry_is_evicted(mock_api, monkeypatch):
+    mock_api.respond({"response": {}})
+    await server.fetch_json("/search", {"q": "a"}, 60)
+    entry_size = server._cache_response_bytes
+    monkeypatch.setattr(server, "CACHE_MAX_RESPONSE_BYTES", 2 * entry_size)
+
+    await server.fetch_json("/search", {"q": "b"}, 60)
+    # Using "a" again makes "b" the least recently used entry
+    await server.fetch_json("/search", {"q": "a"}, 60)
+    await server.fetch_json("/search", {"q": "c"}, 60)
+
+    cached_queries = [dict(params)["q"] for _, params in server._cache]
+    assert cached_queries == ["a", "c"]
+    assert server._cache_response_bytes == 2 * entry_size
+
+
+async def test_expired_entries_are_dropped(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "CACHE_STALE_TTL", 0)
+    monkeypatch.setattr(server, "CACHE_FALLBACK_TTL", 0)
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    mock_api.respond({"response": {"rowCount": 2}})
+    result = await server.fetch_json("/search", {"q": "x"}, 0)
+
+    assert result == {"response": {"rowCount": 2}}
+    assert len(mock_api.requests) == 2
+    assert len(server._cache) == 1
+
+
+async def test_stale_entry_is_served_while_refreshing(mock_api):
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"response": {"rowCount": 2}})
+
+    mock_api.handler = handler
+
+    # Both calls get the stale payload at once and share one background refresh
+    assert await server.fetch_json("/search", {"q": "x"}, 0) == {"response": {"rowCount": 1}}
+    assert await server.fetch_json("/search", {"q": "x"}, 0) == {"response": {"rowCount": 1}}
+    refresh = next(iter(server._inflight.values()))
+
+    release.set()
+    await refresh
+
+    assert len(mock_api.requests) == 2
+    assert await server.fetch_json("/search", {"q": "x"}, 60) == {"response": {"rowCount": 2}}
+
+
+async def test_failed_refresh_keeps_stale_entry(mock_api):
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    mock_api.respond(status_code=503)
+    assert await server.fetch_json("/search", {"q": "x"}, 0) == {"response": {"rowCount": 1}}
+    await asyncio.gather(*server._inflight.values(), return_exceptions=True)
+
+    assert await server.fetch_json("/search", {"q": "x"}, 0) == {"response": {"rowCount": 1}}
+
+
+async def test_outage_serves_cached_entry_past_stale_window(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "CACHE_STALE_TTL", 0)
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    mock_api.respond(status_code=503)
+    result = await server.fetch_json("/search", {"q": "x"}, 0)
+
+    assert result == {"response": {"rowCount": 1}}
+    assert len(mock_api.requests) == 2
+
+
+async def test_outage_after_fallback_window_raises(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "CACHE_STALE_TTL", 0)
+    monkeypatch.setattr(server, "CACHE_FALLBACK_TTL", 0)
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    mock_api.respond(status_code=503)
+    with pytest.raises(httpx.HTTPStatusError):
+        await server.fetch_json("/search", {"q": "x"}, 0)
+
+
+async def test_outage_fallback_covers_transport_errors(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "CACHE_STALE_TTL", 0)
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    mock_api.handler = handler
+
+    assert await server.fetch_json("/search", {"q": "x"}, 0) == {"response": {"rowCount": 1}}
+
+
+async def test_client_error_is_not_masked_by_cached_entry(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "CACHE_STALE_TTL", 0)
+    mock_api.respond({"response": {"rowCount": 1}})
+    await server.fetch_json("/search", {"q": "x"}, 0)
+
+    mock_api.respond(status_code=400)
+    with pytest.raises(httpx.HTTPStatusError):
+        await server.fetch_json("/search", {"q": "x"}, 0)
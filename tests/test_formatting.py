@@ -0,0 +1,140 @@
+"""Tests for the result formatters."""
+
+from smithsonian_mcp_server import server
+
+SEARCH_DATA = {
+    "response": {
+        "rowCount": 5000,
+        "rows": [
+            {
+                "title": "Apollo 11 Command Module",
+                "id": "edanmdm-nasm_A19700102000",
+                "unitCode": "NASM",
+                "content": {
+                    "descriptiveNonRepeating": {
+                        "record_link": "https://airandspace.si.edu/collection/id/nasm_A19700102000",
+                        "online_media": {"mediaCount": 2},
+                    }
+                },
+            },
+            {"title": "Untyped content", "id": "item-2", "content": "not an object"},
+        ],
+    }
+}
+
+
+def test_format_search_results():
+    text = server.format_search_results(SEARCH_DATA)
+
+    assert text.startswith("Found 5000 results\nShowing 2 items:\n")
+    assert "• Apollo 11 Command Module" in text
+    assert "  Link: https://airandspace.si.edu/collection/id/nasm_A19700102000" in text
+    assert "  Online Media: 2 items available" in text
+    assert "• Untyped content\n  ID: item-2\n" in text
+
+
+def test_project_search_results_matches_text_output():
+    projection = server.project_search_results(SEARCH_DATA)
+
+    assert projection["total"] == 5000
+    assert projection["returned"] == 2
+    assert projection["items"][0] == {
+        "title": "Apollo 11 Command Module",
+        "id": "edanmdm-nasm_A19700102000",
+        "unitCode": "NASM",
+        "record_link": "https://airandspace.si.edu/collection/id/nasm_A19700102000",
+        "media_count": 2,
+    }
+    assert projection["items"][1]["record_link"] is None
+    assert projection["items"][1]["media_count"] == 0
+
+
+def test_null_rows_are_treated_as_empty():
+    data = {"response": {"rowCount": 0, "rows": None}}
+
+    assert server.project_search_results(data) == {"total": 0, "returned": 0, "items": []}
+    assert "Showing 0 items:" in server.format_search_results(data)
+
+
+MEDIA_URL = "https://ids.si.edu/ids/deliveryService?id="
+
+ITEM_DATA = {
+    "response": {
+        "title": "Wright Flyer",
+        "id": "edanmdm-nasm_A19610048000",
+        "unitCode": "NASM",
+        "content": {
+            "descriptiveNonRepeating": {
+                "record_link": "https://airandspace.si.edu/collection/id/nasm_A19610048000",
+                "data_source": "National Air and Space Museum",
+                "online_media": {
+                    "mediaCount": 7,
+                    "media": [
+                        {"type": "Images", "content": f"{MEDIA_URL}{i}"}
+                        for i in range(6)
+                    ]
+                    + ["not a media object"],
+                },
+            },
+            "freetext": {
+                "notes": [
+                    {"label": "Summary", "content": "First powered aircraft"},
+                    {"content": "Flown at Kitty Hawk"},
+                    "not a note",
+                    {"label": "Extra", "content": "Hidden"},
+                    {"label": "Extra", "content": "Also hidden"},
+                ],
+                "name": [{"label": "Maker", "content": "Wright Brothers"}],
+                "date": [],
+                "setName": "not a list",
+            },
+        },
+    }
+}
+
+
+def test_format_item_details():
+    text = server.format_item_details(ITEM_DATA)
+
+    assert text == "\n".join(
+        [
+            "Item Details:",
+            "",
+            "Title: Wright Flyer",
+            "ID: edanmdm-nasm_A19610048000",
+            "Unit: NASM",
+            "",
+            "Record Link: https://airandspace.si.edu/collection/id/nasm_A19610048000",
+            "Data Source: National Air and Space Museum",
+            "",
+            "Online Media:",
+            "  Total Items: 7",
+            *(f"  - Images: {MEDIA_URL}{i}" for i in range(5)),
+            "",
+            "Additional Information:",
+            "  notes:",
+            "    Summary: First powered aircraft",
+            "    Flown at Kitty Hawk",
+            "  name:",
+            "    Maker: Wright Brothers",
+        ]
+    )
+
+
+def test_format_item_details_ignores_malformed_content():
+    header = "Item Details:\n\nTitle: Untitled\nID: x\n\n\nAdditional Information:"
+
+    for content in (
+        "not an object",
+        {"descriptiveNonRepeating": "not an object"},
+        {"descriptiveNonRepeating": {"online_media": ["not", "an", "object"]}},
+        {"freetext": "not an object"},
+    ):
+        text = server.format_item_details({"response": {"id": "x", "content": content}})
+        assert text == header
+
+
+def test_format_item_details_without_content():
+    text = server.format_item_details({"response": {"id": "x"}})
+
+    assert text == "Item Details:\n\nTitle: Untitled\nID: x\n\n\nAdditional Information:"
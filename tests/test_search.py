@@ -0,0 +1,141 @@
+"""Tests for the search helpers and the search tools."""
+
+import httpx
+
+from smithsonian_mcp_server import server
+
+
+def search_api(row_count: int):
+    """Build a handler that serves a result set of row_count items, page by page."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        rows = int(request.url.params["rows"])
+        items = [
+            {"id": f"item-{i}", "title": f"Item {i}"}
+            for i in range(start, min(start + rows, row_count))
+        ]
+        return httpx.Response(200, json={"response": {"rowCount": row_count, "rows": items}})
+
+    return handler
+
+
+async def test_paged_search_merges_pages_in_order(mock_api):
+    mock_api.handler = search_api(2500)
+
+    data = await server.search_smithsonian_paged("apollo", total_rows=2500)
+
+    rows = data["response"]["rows"]
+    assert data["response"]["rowCount"] == 2500
+    assert [row["id"] for row in rows] == [f"item-{i}" for i in range(2500)]
+    requested = sorted(
+        (int(r.url.params["start"]), int(r.url.params["rows"])) for r in mock_api.requests
+    )
+    assert requested == [(0, 1000), (1000, 1000), (2000, 500)]
+
+
+async def test_paged_search_stops_at_row_count(mock_api):
+    mock_api.handler = search_api(40)
+
+    data = await server.search_smithsonian_paged("apollo", total_rows=5000)
+
+    assert len(data["response"]["rows"]) == 40
+    assert len(mock_api.requests) == 1
+
+
+async def test_paged_search_honours_start_offset(mock_api):
+    mock_api.handler = search_api(3000)
+
+    data = await server.search_smithsonian_paged("apollo", total_rows=1500, start=1200)
+
+    rows = data["response"]["rows"]
+    assert [row["id"] for row in rows] == [f"item-{i}" for i in range(1200, 2700)]
+    assert len(mock_api.requests) == 2
+
+
+async def test_search_collection_caps_rows(mock_api):
+    mock_api.handler = search_api(10**7)
+
+    result = await server.call_tool("search_collection", {"query": "apollo", "rows": 10**6})
+
+    assert f"Showing {server.MAX_SEARCH_ROWS} items:" in result[0].text
+    assert len(mock_api.requests) == server.MAX_SEARCH_ROWS // server.MAX_ROWS_PER_REQUEST
+
+
+def expand_api(row_count: int, failing_ids: set[str]):
+    """Build a handler serving search results and item details, failing some items."""
+    search = search_api(row_count)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search"):
+            return await search(request)
+        item_id = request.url.path.rsplit("/", 1)[-1]
+        if item_id in failing_ids:
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"response": {"id": item_id, "title": f"Detail {item_id}"}})
+
+    return handler
+
+
+async def test_search_and_expand_reports_partial_failures(mock_api):
+    mock_api.handler = expand_api(100, failing_ids={"item-1"})
+
+    result = await server.call_tool("search_and_expand", {"query": "apollo", "top_k": 3})
+
+    text = result[0].text
+    assert "Found 100 results, showing details for the top 3:" in text
+    assert "Title: Detail item-0" in text
+    assert "Item item-1: Error:" in text
+    assert "Title: Detail item-2" in text
+
+
+async def test_search_and_expand_clamps_top_k(mock_api):
+    mock_api.handler = expand_api(100, failing_ids=set())
+
+    await server.call_tool("search_and_expand", {"query": "apollo", "top_k": 1000})
+    detail_requests = [r for r in mock_api.requests if "/content/" in r.url.path]
+    assert len(detail_requests) == server.MAX_EXPAND_ITEMS
+
+
+async def test_search_and_expand_fetches_at_least_one_item(mock_api):
+    mock_api.handler = expand_api(100, failing_ids=set())
+
+    await server.call_tool("search_and_expand", {"query": "apollo", "top_k": 0})
+    detail_requests = [r for r in mock_api.requests if "/content/" in r.url.path]
+    assert len(detail_requests) == 1
+
+
+async def test_search_and_expand_skips_rows_without_id(mock_api):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search"):
+            rows = [{"title": "no id"}, {"id": "item-1", "title": "Item 1"}]
+            return httpx.Response(200, json={"response": {"rowCount": 2, "rows": rows}})
+        item_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"response": {"id": item_id, "title": f"Detail {item_id}"}})
+
+    mock_api.handler = handler
+
+    result = await server.call_tool("search_and_expand", {"query": "apollo", "top_k": 2})
+
+    text = result[0].text
+    assert "showing details for the top 1:" in text
+    assert "Title: Detail item-1" in text
+    assert "Untitled" not in text
+    assert [r.url.path for r in mock_api.requests if "/content/" in r.url.path] == [
+        "/openaccess/api/v1.0/content/item-1"
+    ]
+
+
+async def test_search_and_expand_handles_null_rows(mock_api):
+    mock_api.respond({"response": {"rowCount": 0, "rows": None}})
+
+    result = await server.call_tool("search_and_expand", {"query": "apollo"})
+
+    assert result[0].text == "Found 0 results, showing details for the top 0:"
+
+
+async def test_search_and_expand_checks_query_before_top_k(mock_api):
+    result = await server.call_tool("search_and_expand", {"top_k": "many"})
+
+    assert result[0].text == "Error: query parameter is required"
+    assert not mock_api.requests